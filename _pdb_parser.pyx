@@ -0,0 +1,103 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled single-pass PDB record parser.
+
+Build in place with:  python setup.py build_ext --inplace
+
+The analysis scripts fall back to their pure-Python parsers when this
+module is not compiled.
+"""
+
+from libc.stdlib cimport strtod, strtol
+from libc.string cimport memcmp, memcpy
+
+import numpy as np
+
+
+cdef double _ffield(const unsigned char* line, int start, int stop):
+    cdef char buf[24]
+    memcpy(buf, line + start, stop - start)
+    buf[stop - start] = 0
+    return strtod(buf, NULL)
+
+
+cdef long _ifield(const unsigned char* line, int start, int stop):
+    cdef char buf[24]
+    memcpy(buf, line + start, stop - start)
+    buf[stop - start] = 0
+    return strtol(buf, NULL, 10)
+
+
+def parse(const unsigned char[:] data):
+    """Parse raw PDB bytes in one pass.
+
+    Returns (helices, sheets, names, resnames, chains, resnums, coords,
+    b_factors). Helices and sheets are lists of (name, chain_id,
+    resseq1, resseq2) tuples; the rest are per-ATOM NumPy arrays
+    ('S4', 'S3', 'S1', int32, float32 (N, 3), float32).
+    """
+    cdef Py_ssize_t n = data.shape[0]
+    cdef const unsigned char* buf
+    cdef Py_ssize_t pos = 0, eol, length
+    cdef Py_ssize_t n_atoms = 0
+    cdef Py_ssize_t i = 0
+    cdef const unsigned char* line
+
+    if n == 0:
+        buf = NULL
+    else:
+        buf = &data[0]
+
+    # First pass: count ATOM records so the arrays can be preallocated.
+    while pos < n:
+        eol = pos
+        while eol < n and buf[eol] != 10:
+            eol += 1
+        if eol - pos >= 66 and memcmp(buf + pos, b"ATOM  ", 6) == 0:
+            n_atoms += 1
+        pos = eol + 1
+
+    names = np.empty(n_atoms, dtype='S4')
+    resnames = np.empty(n_atoms, dtype='S3')
+    chains = np.empty(n_atoms, dtype='S1')
+    resnums = np.empty(n_atoms, dtype=np.int32)
+    coords = np.empty((n_atoms, 3), dtype=np.float32)
+    b_factors = np.empty(n_atoms, dtype=np.float32)
+    cdef int[:] resnums_v = resnums
+    cdef float[:, :] coords_v = coords
+    cdef float[:] b_factors_v = b_factors
+    helices = []
+    sheets = []
+
+    pos = 0
+    while pos < n:
+        eol = pos
+        while eol < n and buf[eol] != 10:
+            eol += 1
+        length = eol - pos
+        line = buf + pos
+        if length >= 66 and memcmp(line, b"ATOM  ", 6) == 0:
+            names[i] = bytes(data[pos + 12:pos + 16]).strip()
+            resnames[i] = bytes(data[pos + 17:pos + 20]).strip()
+            chains[i] = bytes(data[pos + 21:pos + 22])
+            resnums_v[i] = <int>_ifield(line, 22, 26)
+            coords_v[i, 0] = <float>_ffield(line, 30, 38)
+            coords_v[i, 1] = <float>_ffield(line, 38, 46)
+            coords_v[i, 2] = <float>_ffield(line, 46, 54)
+            b_factors_v[i] = <float>_ffield(line, 60, 66)
+            i += 1
+        elif length >= 38 and memcmp(line, b"HELIX ", 6) == 0:
+            helices.append((
+                bytes(data[pos + 11:pos + 14]).strip().decode(),
+                chr(line[19]),
+                <int>_ifield(line, 21, 25),
+                <int>_ifield(line, 33, 37)))
+        elif length >= 38 and memcmp(line, b"SHEET ", 6) == 0:
+            sheets.append((
+                bytes(data[pos + 11:pos + 14]).strip().decode(),
+                chr(line[21]),
+                <int>_ifield(line, 22, 26),
+                <int>_ifield(line, 33, 37)))
+        pos = eol + 1
+
+    return helices, sheets, names, resnames, chains, resnums, \
+        coords, b_factors
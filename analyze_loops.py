@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Identify loop regions in a PDB structure and report their B-factors.
+
+A loop is any stretch of consecutive residues that is not covered by a
+HELIX or SHEET record in the PDB header.
+"""
+
+import argparse
+import os
+import sys
+from collections import Counter
+from multiprocessing import Pool
+
+import numpy as np
+
+import pdb_io
+
+
+def encode_residue(chain_id, resnum):
+    """Pack (chain_id, resnum) into a single int64 sort/search key."""
+    return (ord(chain_id) << 24) | (resnum & 0xFFFFFF)
+
+
+def parse_pdb(pdb_file):
+    """Load a PDB file via pdb_io and derive the loop-analysis views.
+
+    Returns (structured_keys, atoms, ca_xyz, ca_index) where
+    structured_keys is a sorted int64 array of encode_residue() keys
+    covered by a HELIX or SHEET record, atoms holds the ATOM records as
+    parallel NumPy arrays 'chains' (S1), 'resnums' (int32), 'resnames'
+    (S3) and 'b_factors' (float32) sorted by residue, plus a
+    'residue_index' dict mapping (chain_id, resnum) to that residue's
+    (start, stop) slice; ca_xyz is an (N, 3) float32 array of
+    alpha-carbon positions and ca_index maps (chain_id, resnum) to a
+    row in it.
+    """
+    helices, sheets, raw_atoms = pdb_io.load(pdb_file)
+    structured = [encode_residue(chain_id, resnum)
+                  for _, chain_id, start, end in helices + sheets
+                  for resnum in range(start, end + 1)]
+    chains = raw_atoms['chains']
+    resnums = raw_atoms['resnums']
+    rows = np.flatnonzero(raw_atoms['names'] == b'CA')
+    ca_xyz = raw_atoms['coords'][rows]
+    ca_index = {(chains[row].decode(), int(resnums[row])): i
+                for i, row in enumerate(rows)}
+    return _index_atoms(structured, chains, resnums,
+                        raw_atoms['resnames'], raw_atoms['b_factors'],
+                        ca_xyz, ca_index)
+
+
+def _index_atoms(structured, chains, resnums, resnames, b_factors,
+                 ca_xyz, ca_index):
+    """Sort the atom arrays by residue and assemble parse_pdb's result."""
+    # Sort atoms by residue and record each residue's (start, stop)
+    # slice so per-residue access is a contiguous array view.
+    order = np.lexsort((resnums, chains))
+    chains = chains[order]
+    resnums = resnums[order]
+    resnames = resnames[order]
+    b_factors = b_factors[order]
+    residue_index = {}
+    if len(chains):
+        changes = np.flatnonzero((chains[1:] != chains[:-1])
+                                 | (resnums[1:] != resnums[:-1])) + 1
+        starts = np.concatenate(([0], changes))
+        stops = np.concatenate((changes, [len(chains)]))
+        residue_index = {
+            (chains[start].decode(), int(resnums[start])):
+                (int(start), int(stop))
+            for start, stop in zip(starts, stops)}
+
+    atoms = {
+        'chains': chains,
+        'resnums': resnums,
+        'resnames': resnames,
+        'b_factors': b_factors,
+        'residue_index': residue_index,
+    }
+    structured_keys = np.unique(np.array(structured, dtype=np.int64))
+    return structured_keys, atoms, ca_xyz, ca_index
+
+
+def identify_loops(residue_index, structured_keys):
+    """Group consecutive unstructured residues into loop regions."""
+    all_keys = np.fromiter(
+        (encode_residue(chain_id, resnum)
+         for chain_id, resnum in residue_index),
+        dtype=np.int64, count=len(residue_index))
+    all_keys.sort()
+    mask = ~np.isin(all_keys, structured_keys, assume_unique=True)
+    loop_keys = all_keys[mask]
+    if not len(loop_keys):
+        return []
+    # Consecutive residues of one chain differ by exactly 1 in key
+    # space, so run boundaries fall out of a single vectorized diff.
+    gaps = np.diff(loop_keys) != 1
+    chain_changed = (loop_keys[1:] >> 24) != (loop_keys[:-1] >> 24)
+    breaks = np.flatnonzero(gaps | chain_changed) + 1
+    return [[(chr(key >> 24), int(key & 0xFFFFFF)) for key in group]
+            for group in np.split(loop_keys, breaks)]
+
+
+def analyze_loops(pdb_file):
+    """Build the loop report for one PDB file, returning it as a string."""
+    structured_keys, atoms, ca_xyz, ca_index = parse_pdb(pdb_file)
+    residue_index = atoms['residue_index']
+    loops = identify_loops(residue_index, structured_keys)
+
+    out = [f'Found {len(loops)} loop regions in {pdb_file}\n']
+    # Dict keyed by residue: O(1) duplicate checks while keeping
+    # insertion order for the composition summary.
+    residue_info = {}
+    for index, loop in enumerate(loops, start=1):
+        for chain_id, resnum in loop:
+            key = (chain_id, resnum)
+            if key not in residue_info:
+                row = residue_index[key][0]
+                residue_info[key] = atoms['resnames'][row].decode()
+        # The atoms of a loop's residues form one contiguous slice of
+        # the sorted arrays, so the average is a single vectorized mean.
+        first, _ = residue_index[loop[0]]
+        _, last = residue_index[loop[-1]]
+        avg_b = atoms['b_factors'][first:last].mean()
+        chain_id, start = loop[0]
+        _, end = loop[-1]
+        span = ''
+        start_row = ca_index.get((chain_id, start))
+        end_row = ca_index.get((chain_id, end))
+        if start_row is not None and end_row is not None:
+            distance = np.linalg.norm(ca_xyz[end_row] - ca_xyz[start_row])
+            span = f', CA span {distance:.2f} A'
+        out.append(f'Loop {index}: chain {chain_id} residues {start}-{end} '
+                   f'({len(loop)} residues), average B-factor '
+                   f'{avg_b:.2f}{span}\n')
+
+    composition = Counter(residue_info.values())
+    out.append('Most common loop residues:\n')
+    for resname, count in composition.most_common(5):
+        out.append(f'  {resname}: {count}\n')
+    return ''.join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Identify loop regions in a PDB file.')
+    parser.add_argument('pdb_file', nargs='?',
+                        help='path to the PDB file to analyze')
+    parser.add_argument('--input-list', metavar='FILE',
+                        help='file listing one PDB path per line; the '
+                             'files are analyzed in parallel')
+    args = parser.parse_args()
+    if bool(args.pdb_file) == bool(args.input_list):
+        parser.error('give either a PDB file or --input-list')
+    if args.input_list:
+        with open(args.input_list) as handle:
+            paths = [line.strip() for line in handle if line.strip()]
+        with Pool(os.cpu_count()) as pool:
+            for report in pool.imap_unordered(analyze_loops, paths,
+                                              chunksize=4):
+                sys.stdout.write(report)
+    else:
+        sys.stdout.write(analyze_loops(args.pdb_file))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Summarize the helices and sheets declared in a PDB file.
+
+For every HELIX and SHEET record the script reports the residue range,
+its length and the end-to-end distance between the alpha carbons of the
+first and last residue.
+"""
+
+import argparse
+import os
+import sys
+from multiprocessing import Pool
+
+import numpy as np
+
+import pdb_io
+
+
+def parse_pdb(pdb_file):
+    """Load a PDB file via pdb_io and derive the helix/sheet views.
+
+    Returns (helices, sheets, ca_xyz, ca_index). Helices and sheets are
+    lists of dicts with keys 'name', 'chain_id', 'resseq1' and
+    'resseq2'; ca_xyz is an (N, 3) float32 array of alpha-carbon
+    positions and ca_index maps (chain_id, resnum) to a row in it.
+    """
+    raw_helices, raw_sheets, atoms = pdb_io.load(pdb_file)
+    helices = [{'name': name, 'chain_id': chain_id,
+                'resseq1': resseq1, 'resseq2': resseq2}
+               for name, chain_id, resseq1, resseq2 in raw_helices]
+    sheets = [{'name': name, 'chain_id': chain_id,
+               'resseq1': resseq1, 'resseq2': resseq2}
+              for name, chain_id, resseq1, resseq2 in raw_sheets]
+    rows = np.flatnonzero(atoms['names'] == b'CA')
+    ca_xyz = atoms['coords'][rows]
+    ca_index = {(atoms['chains'][row].decode(), int(atoms['resnums'][row])): i
+                for i, row in enumerate(rows)}
+    return helices, sheets, ca_xyz, ca_index
+
+
+def end_to_end_distances(elements, ca_xyz, ca_index):
+    """Distance between the first and last CA of each element.
+
+    Returns a float array aligned with elements; entries whose end
+    residues have no CA in the structure are NaN.
+    """
+    distances = np.full(len(elements), np.nan)
+    starts = []
+    ends = []
+    rows = []
+    for i, element in enumerate(elements):
+        start_row = ca_index.get((element['chain_id'], element['resseq1']))
+        end_row = ca_index.get((element['chain_id'], element['resseq2']))
+        if start_row is not None and end_row is not None:
+            starts.append(start_row)
+            ends.append(end_row)
+            rows.append(i)
+    if rows:
+        diff = ca_xyz[ends] - ca_xyz[starts]
+        distances[rows] = np.linalg.norm(diff, axis=1)
+    return distances
+
+
+def describe_element(kind, element, distance):
+    """Build the report line for one helix or sheet."""
+    start = element['resseq1']
+    end = element['resseq2']
+    length = end - start + 1
+    span = '' if np.isnan(distance) else \
+        f', end-to-end CA distance {distance:.2f} A'
+    return (f'{kind} {element["name"]}: chain {element["chain_id"]} residues '
+            f'{start}-{end} ({length} residues){span}')
+
+
+def analyze_secondary_structure(pdb_file):
+    """Build the helix/sheet report for one PDB file as a string."""
+    helices, sheets, ca_xyz, ca_index = parse_pdb(pdb_file)
+    elements = helices + sheets
+    kinds = ['Helix'] * len(helices) + ['Sheet'] * len(sheets)
+    distances = end_to_end_distances(elements, ca_xyz, ca_index)
+    out = [f'Found {len(helices)} helices and {len(sheets)} sheets '
+           f'in {pdb_file}\n']
+    for kind, element, distance in zip(kinds, elements, distances):
+        out.append(describe_element(kind, element, distance) + '\n')
+    return ''.join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Summarize helices and sheets in a PDB file.')
+    parser.add_argument('pdb_file', nargs='?',
+                        help='path to the PDB file to analyze')
+    parser.add_argument('--input-list', metavar='FILE',
+                        help='file listing one PDB path per line; the '
+                             'files are analyzed in parallel')
+    args = parser.parse_args()
+    if bool(args.pdb_file) == bool(args.input_list):
+        parser.error('give either a PDB file or --input-list')
+    if args.input_list:
+        with open(args.input_list) as handle:
+            paths = [line.strip() for line in handle if line.strip()]
+        with Pool(os.cpu_count()) as pool:
+            for report in pool.imap_unordered(analyze_secondary_structure,
+                                              paths, chunksize=4):
+                sys.stdout.write(report)
+    else:
+        sys.stdout.write(analyze_secondary_structure(args.pdb_file))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""Shared single-pass PDB parser for the analysis scripts.
+
+load() caches parsed files on (path, mtime, size), so running several
+analyses over the same structure in one process parses it only once.
+Uses the compiled _pdb_parser kernel when it has been built (see
+setup.py) and falls back to a pure-Python mmap parser otherwise.
+"""
+
+import functools
+import mmap
+import os
+import struct
+
+import numpy as np
+
+try:
+    import _pdb_parser
+except ImportError:  # compiled parser is optional; see setup.py
+    _pdb_parser = None
+
+# Fixed 66-column ATOM record layout: record name, serial, atom name,
+# altLoc, resName, chainID, resSeq, iCode, x, y, z, occupancy, B-factor.
+ATOM_RECORD = struct.Struct('6s5s1x4s1s3s1x1s4s1s3x8s8s8s6s6s')
+
+
+def load(pdb_file):
+    """Parse pdb_file, reusing the cached result while it is unchanged.
+
+    Returns (helices, sheets, atoms). Helices and sheets are lists of
+    (name, chain_id, resseq1, resseq2) tuples; atoms is a dict of
+    parallel per-ATOM NumPy arrays in file order: 'names' (S4),
+    'resnames' (S3), 'chains' (S1), 'resnums' (int32), 'coords'
+    (float32 (N, 3)) and 'b_factors' (float32).
+    """
+    stat = os.stat(pdb_file)
+    return _load(pdb_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load(pdb_file, mtime_ns, size):
+    if _pdb_parser is not None:
+        with open(pdb_file, 'rb') as handle:
+            data = handle.read()
+        helices, sheets, names, resnames, chains, resnums, coords, \
+            b_factors = _pdb_parser.parse(data)
+    else:
+        helices, sheets, names, resnames, chains, resnums, coords, \
+            b_factors = _parse(pdb_file)
+    atoms = {
+        'names': names,
+        'resnames': resnames,
+        'chains': chains,
+        'resnums': resnums,
+        'coords': coords,
+        'b_factors': b_factors,
+    }
+    return helices, sheets, atoms
+
+
+def _parse(pdb_file):
+    """Pure-Python single pass over the mmap'd file bytes."""
+    helices = []
+    sheets = []
+    names = []
+    resnames = []
+    chains = []
+    resnums = []
+    coords = []
+    b_factors = []
+
+    def _atom(line):
+        if len(line) < ATOM_RECORD.size:
+            return
+        # One C-level unpack per record; int() and float() accept the
+        # space-padded byte fields as-is.
+        (_, _, name, _, resname, chain, resseq, _,
+         x, y, z, _, b_factor) = ATOM_RECORD.unpack_from(line)
+        names.append(name.strip())
+        resnames.append(resname.strip())
+        chains.append(chain)
+        resnums.append(int(resseq))
+        coords.append((float(x), float(y), float(z)))
+        b_factors.append(float(b_factor))
+
+    def _helix(line):
+        helices.append((line[11:14].strip().decode(),
+                        line[19:20].decode(),
+                        int(line[21:25]), int(line[33:37])))
+
+    def _sheet(line):
+        sheets.append((line[11:14].strip().decode(),
+                       line[21:22].decode(),
+                       int(line[22:26]), int(line[33:37])))
+
+    # Single hash lookup on the 6-byte record name instead of a chain
+    # of startswith calls per line.
+    dispatch = {b'ATOM  ': _atom, b'HELIX ': _helix, b'SHEET ': _sheet}
+    with open(pdb_file, 'rb') as handle:
+        mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            line = mm.readline()
+            while line:
+                handler = dispatch.get(line[:6])
+                if handler is not None:
+                    handler(line)
+                line = mm.readline()
+        finally:
+            mm.close()
+
+    return (helices, sheets,
+            np.array(names, dtype='S4'),
+            np.array(resnames, dtype='S3'),
+            np.array(chains, dtype='S1'),
+            np.array(resnums, dtype=np.int32),
+            np.array(coords, dtype=np.float32).reshape(-1, 3),
+            np.array(b_factors, dtype=np.float32))
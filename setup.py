@@ -0,0 +1,12 @@
+"""Build the optional compiled PDB parser:
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='pdb-analysis-tools',
+    ext_modules=cythonize('_pdb_parser.pyx'),
+)